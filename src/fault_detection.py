@@ -0,0 +1,310 @@
+"""Fault classification: train on the Helwig hydraulic dataset, score twin data."""
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import joblib
+
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # headless raster backend: no GUI toolkit probing
+import matplotlib.pyplot as plt
+import sklearn
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.metrics import classification_report
+from sklearn.model_selection import train_test_split
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional: fall back to the pandas parser
+    pacsv = None
+
+plt.style.use("seaborn-v0_8-whitegrid")
+
+HELWIG_DIR = Path("data/helwig")
+OUTPUT_DIR = Path("output")
+TWIN_CSV = "twin_data.csv"
+
+# per-cycle sensor grids: pressure at 100 Hz, flow at 10 Hz (60 s cycles)
+PS_FILES = [f"PS{i}.txt" for i in (1, 2, 3, 4, 5, 6)]
+FS_FILES = ["FS1.txt", "FS2.txt"]
+PROFILE_COLS = ["cooler", "valve", "pump", "accumulator", "stable"]
+
+
+def _load_grid(path):
+    """
+    Load one tab-separated sensor grid, caching a binary .npy sidecar next
+    to it. The ASCII parse runs once per file ever; afterwards np.load on
+    the .npy is a header read plus mmap, so repeat loads are near-free.
+    """
+    npy = path.with_suffix(".npy")
+    if npy.exists():
+        return np.load(npy, mmap_mode="r")
+    arr = np.loadtxt(path, dtype=np.float32)
+    np.save(npy, arr)
+    return arr
+
+
+def read_avg(files):
+    """
+    Average a set of per-cycle sensor grids down to one value per cycle.
+    Grids come in as float32 arrays (binary-cached by _load_grid), then a
+    single fused mean over files and samples, so the data is streamed once
+    with no intermediate DataFrames. Files are independent and the parser
+    spends its time in GIL-releasing C code, so a small thread pool
+    overlaps the reads.
+    """
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        arrs = list(ex.map(_load_grid, files))
+    stk = np.stack(arrs, axis=0)   # (n_files, cycles, samples)
+    return stk.mean(axis=(0, 2))
+
+
+def load_helwig(helwig_dir=HELWIG_DIR):
+    """Load the Helwig condition-monitoring set as per-cycle features."""
+    pressure = read_avg([helwig_dir / f for f in PS_FILES])
+    flow = read_avg([helwig_dir / f for f in FS_FILES])
+    # profile.txt holds small-integer class codes: int16 is 4x smaller than
+    # pandas' default int64 (the accumulator code 130 overflows int8) and
+    # the grid parses in one loadtxt call
+    profile = np.loadtxt(helwig_dir / "profile.txt", dtype=np.int16)
+
+    # filter to stable cycles on the raw arrays: one boolean mask applied
+    # per column, instead of building the full frame and then copying and
+    # reindexing every column through df[df["stable"] == 0]
+    mask = profile[:, PROFILE_COLS.index("stable")] == 0
+
+    # one dict -> one DataFrame; the old concat allocated a second frame
+    # and reindexed every column just to glue the label block on
+    data = {"pressure": pressure[mask], "flow": flow[mask]}
+    for j, col in enumerate(PROFILE_COLS):
+        data[col] = profile[mask, j]
+    return pd.DataFrame(data)
+
+
+def load_twin(twin_csv=TWIN_CSV):
+    """Load the pressure/flow telemetry produced by the twin generator."""
+    if pacsv is None:
+        # float32 at parse time, matching the Arrow path below: sensor data
+        # has ~16-bit effective resolution, so half the memory traffic is free
+        df = pd.read_csv(
+            twin_csv,
+            usecols=["pressure", "flow"],
+            dtype={"pressure": np.float32, "flow": np.float32},
+        )
+    else:
+        # Arrow's C++ tokenizer, reading only the two needed columns as f32
+        df = pacsv.read_csv(
+            twin_csv,
+            convert_options=pacsv.ConvertOptions(
+                include_columns=["pressure", "flow"],
+                column_types={"pressure": pa.float32(), "flow": pa.float32()},
+            ),
+        ).to_pandas()
+    return df.dropna().reset_index(drop=True)
+
+
+def train_model(df_helwig, validate=False):
+    """
+    Train a gradient-boosted valve-condition classifier on pressure/flow.
+    Returns the fitted model plus the training-set band statistics
+    (mu/sd per feature) so callers never re-reduce the columns.
+
+    With validate=True a stratified 80/20 split is held out and a
+    classification report printed; the default trains on the full set,
+    skipping the split and the per-class stratify scan.
+    """
+    # contiguous float32 arrays once, up front: sklearn's check_array then
+    # has nothing to convert on fit or on any later predict call
+    X = df_helwig[["pressure", "flow"]].to_numpy(dtype=np.float32)
+    y = df_helwig["valve"].to_numpy()
+
+    # the dataset is static, so its band stats are constants: fold the four
+    # column reductions into training instead of redoing them per dashboard
+    mu = X.mean(axis=0)
+    sd = X.std(axis=0, ddof=1)
+    stats = {"mu_p": float(mu[0]), "sd_p": float(sd[0]),
+             "mu_f": float(mu[1]), "sd_f": float(sd[1])}
+    if validate:
+        X_train, X_val, y_train, y_val = train_test_split(
+            X, y, test_size=0.2, random_state=42, stratify=y
+        )
+    else:
+        X_train, y_train = X, y
+
+    # no feature scaling: tree splits are invariant to monotone transforms.
+    # histogrammed GBDT: features are binned once up front and predict is a
+    # tight C loop over binned thresholds, much faster than dispatching a
+    # forest of independent trees and just as accurate on 2 features
+    clf = HistGradientBoostingClassifier(
+        max_iter=100, max_depth=8, learning_rate=0.1, random_state=42,
+    )
+    clf.fit(X_train, y_train)
+    if validate:
+        print(classification_report(y_val, clf.predict(X_val)))
+    return clf, stats
+
+
+# one session per fitted classifier: convert_sklearn + InferenceSession
+# construction costs more than the predict it replaces, so rebuilding per
+# render would wipe out the win. Failed conversions are cached as None so
+# the fallback path doesn't re-attempt them either.
+_ONNX_CACHE = {}
+
+
+def to_onnx_session(clf):
+    """
+    Convert the fitted classifier to an onnxruntime session, replacing
+    sklearn's per-tree Python dispatch with one fused C++ kernel. Returns
+    None when the onnx stack is not installed or cannot convert this
+    model type, in which case callers fall back to sklearn's predict.
+    The result (None included) is cached per classifier instance.
+    """
+    key = id(clf)
+    if key in _ONNX_CACHE:
+        return _ONNX_CACHE[key]
+    _ONNX_CACHE[key] = sess = _convert_to_onnx(clf)
+    return sess
+
+
+def _convert_to_onnx(clf):
+    try:
+        import onnxruntime as ort
+        from skl2onnx import convert_sklearn
+        from skl2onnx.common.data_types import FloatTensorType
+    except ImportError:
+        return None
+    try:
+        onx = convert_sklearn(
+            clf,
+            initial_types=[("X", FloatTensorType([None, 2]))],
+            options={id(clf): {"zipmap": False}},  # probabilities as one tensor
+        )
+    except Exception:  # converter coverage varies across skl2onnx versions
+        return None
+    return ort.InferenceSession(onx.SerializeToString())
+
+
+# figure reused across visualize_industrial calls: building axes, artists
+# and running tight_layout dominates the draw cost, so a dashboard loop
+# only pays for set_data + savefig after the first call
+_FIG_CACHE = {}
+
+
+def _build_panel():
+    """Create the three-panel figure once, with empty data artists."""
+    fig, ax = plt.subplots(3, 1, figsize=(11, 7), sharex=True)
+
+    lines = {
+        "pressure": ax[0].plot([], [], color="tab:blue", lw=1, rasterized=True)[0],
+        "flow": ax[1].plot([], [], color="tab:green", lw=1, rasterized=True)[0],
+        "prob": ax[2].plot([], [], color="tab:red", lw=1, rasterized=True)[0],
+    }
+    # axhspan draws the 3-sigma band as one axis-spanning rectangle, where
+    # fill_between built an N-point polygon the renderer had to walk
+    bands = [
+        ax[0].axhspan(0.0, 1.0, color="red", alpha=0.07),
+        ax[1].axhspan(0.0, 1.0, color="red", alpha=0.07),
+    ]
+    alerts = ax[2].scatter([], [], s=6, color="black", zorder=3)
+    ax[2].axhline(0.7, color="black", ls="--", lw=0.8)
+
+    ax[0].set_ylabel("Pressure (bar)")
+    ax[0].set_title("Pump telemetry vs. trained fault model")
+    ax[1].set_ylabel("Flow (l/min)")
+    ax[2].set_ylabel("Fault probability")
+    ax[2].set_xlabel("Sample")
+    fig.tight_layout()
+
+    _FIG_CACHE.update(fig=fig, ax=ax, lines=lines, bands=bands, alerts=alerts)
+
+
+def visualize_industrial(clf, df_twin, stats,
+                         out_path=OUTPUT_DIR / "industrial_panel.png",
+                         n_points=300):
+    """Three-panel dashboard: pressure, flow and predicted fault probability."""
+    n_points = min(n_points, len(df_twin))
+    start = np.random.randint(0, max(1, len(df_twin) - n_points))
+    stop = start + n_points
+
+    # slice the underlying column arrays directly: everything downstream is
+    # positional, so the iloc copy + index rebuild bought nothing
+    pressure = df_twin["pressure"].to_numpy()[start:stop]
+    flow = df_twin["flow"].to_numpy()[start:stop]
+    X_twin = np.ascontiguousarray(
+        np.stack([pressure, flow], axis=1), dtype=np.float32
+    )
+
+    sess = to_onnx_session(clf)
+    if sess is not None:
+        # one session run yields both quantities, traversing the trees once
+        probs = sess.run(None, {"X": X_twin})[1]
+    else:
+        # predict() is just argmax over predict_proba(): call the latter
+        # once and derive both, halving the tree traversals. load_twin
+        # already dropped NaNs, so skip the finiteness scan too.
+        with sklearn.config_context(assume_finite=True):
+            probs = clf.predict_proba(X_twin)
+    fault_prob = probs.max(axis=1)
+    pred_valve = clf.classes_[probs.argmax(axis=1)]
+    # branchless alert flagging: one vectorized compare, no per-row test
+    alert = fault_prob >= 0.7
+
+    mu_p, sd_p = stats["mu_p"], stats["sd_p"]
+    mu_f, sd_f = stats["mu_f"], stats["sd_f"]
+
+    if not _FIG_CACHE:
+        _build_panel()
+    fig, ax = _FIG_CACHE["fig"], _FIG_CACHE["ax"]
+    lines, bands = _FIG_CACHE["lines"], _FIG_CACHE["bands"]
+
+    t = np.arange(n_points)
+    lines["pressure"].set_data(t, pressure)
+    lines["flow"].set_data(t, flow)
+    lines["prob"].set_data(t, fault_prob)
+    for band, (lo, hi) in zip(bands, [(mu_p - 3 * sd_p, mu_p + 3 * sd_p),
+                                      (mu_f - 3 * sd_f, mu_f + 3 * sd_f)]):
+        band.set_y(lo)
+        band.set_height(hi - lo)
+    _FIG_CACHE["alerts"].set_offsets(np.column_stack((t[alert], fault_prob[alert])))
+
+    vals, counts = np.unique(pred_valve, return_counts=True)
+    lines["prob"].set_label(f"pred. valve condition: {vals[counts.argmax()]}")
+    _FIG_CACHE["alerts"].set_label(f"alerts: {int(alert.sum())}")
+    ax[2].legend(loc="upper right")
+
+    # fit the limits to the new data once, then freeze autoscale so the
+    # save-time draw doesn't rescan every artist's data bounds
+    for a in ax:
+        a.set_autoscale_on(True)
+        a.relim()
+        a.autoscale_view()
+        a.set_autoscale_on(False)
+
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    # 150 dpi quarters the pixel count vs 300; plenty for an 11-inch panel
+    fig.savefig(out_path, dpi=150)
+    print(f"✅ Saved dashboard to {out_path}")
+
+
+if __name__ == "__main__":
+    if not HELWIG_DIR.exists():
+        print("⚠️ Helwig dataset not found (expected under data/helwig).")
+    else:
+        # the training data is static, so cache the fitted model and its
+        # band stats keyed by a hash of profile.txt and skip retraining;
+        # on a cache hit the Helwig grids are never read at all
+        OUTPUT_DIR.mkdir(exist_ok=True)
+        key = hashlib.sha256((HELWIG_DIR / "profile.txt").read_bytes()).hexdigest()[:12]
+        cache = OUTPUT_DIR / f"clf_{key}.joblib"
+        if cache.exists():
+            clf, stats = joblib.load(cache)
+            print(f"ℹ️ Loaded cached classifier ({cache.name})")
+        else:
+            clf, stats = train_model(load_helwig())
+            joblib.dump((clf, stats), cache, compress=3)
+
+        df_twin = load_twin()
+        visualize_industrial(clf, df_twin, stats)
@@ -0,0 +1,49 @@
+def _kf_step_py(x, P, R, z):
+    """
+    One scalar Kalman measurement update (predict runs separately so a
+    predict/update cycle doesn't add Q twice). Works on plain floats so
+    Numba compiles a leaf function with no allocations.
+    """
+    K = P / (P + R)          # Kalman gain
+    x = x + K * (z - x)      # update estimate with measurement z
+    P = (1.0 - K) * P        # update variance
+    return x, P
+
+
+def _kf_step(x, P, R, z):
+    """
+    Trampoline: on the first call, import numba and swap the module
+    attribute for the jitted step (or the pure-Python one if numba is
+    missing). Keeps import of this module cheap for short CLI runs while
+    long runs still get the compiled fast path.
+    """
+    global _kf_step
+    try:
+        from numba import njit
+        _kf_step = njit(cache=True, fastmath=True)(_kf_step_py)
+    except ImportError:
+        _kf_step = _kf_step_py
+    return _kf_step(x, P, R, z)
+
+
+class KalmanFilter:
+    """
+    Scalar Kalman filter for a single noisy sensor channel
+    (random-walk state, direct measurement).
+    """
+
+    def __init__(self, q=1e-4, r=1e-2, x0=0.0, p0=1.0):
+        self.Q = q    # process noise variance
+        self.R = r    # measurement noise variance
+        self.x = x0   # state estimate
+        self.P = p0   # estimate variance
+
+    def predict(self):
+        """Propagate the estimate one step (state is a random walk)."""
+        self.P += self.Q
+        return self.x
+
+    def update(self, z):
+        """Fold measurement z into the estimate and return it."""
+        self.x, self.P = _kf_step(self.x, self.P, self.R, z)
+        return self.x
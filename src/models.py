@@ -1,9 +1,11 @@
+from .constants import INERTIA, MOTOR_TORQUE, LOAD_TORQUE, DT
+
+
 def fx(omega, friction):
     """
     Process model: update shaft speed (ω).
     dω/dt = (τm - τl - friction * ω) / J
     """
-    from .constants import INERTIA, MOTOR_TORQUE, LOAD_TORQUE, DT
     domega = (MOTOR_TORQUE - LOAD_TORQUE - friction * omega) / INERTIA
     return omega + domega * DT
 
@@ -1,33 +1,64 @@
 import logging
-from .constants import SIMULATION_STEPS, DT, MAX_SPEED, MAX_TEMP
+
+import numpy as np
+
+from .constants import SIMULATION_STEPS, MAX_SPEED, MAX_TEMP
 from .models import fx, hx
 
 # configure logging
 logging.basicConfig(filename="simulation.log", level=logging.INFO, filemode="w")
+logger = logging.getLogger(__name__)
+
+# sensor channels monitored each step
+SENSORS = ["omega", "temp"]
+NOISE_STD = np.array([0.5, 0.2])          # measurement noise per sensor
+THRESHOLDS = np.array([MAX_SPEED, MAX_TEMP])
+
 
 def run():
     omega = 0.0          # initial shaft speed
     friction = 0.01      # initial friction
     temp = 25.0          # initial temp (°C)
 
+    rng = np.random.default_rng(42)
+    log_info = logger.isEnabledFor(logging.INFO)
+
+    # One scalar Kalman filter per sensor, but kept as plain (n,) arrays so
+    # every predict+update is a handful of vectorized numpy ops instead of
+    # per-filter Python calls and 1x1 matrix math.
+    n = len(SENSORS)
+    x = np.array([omega, temp])   # filtered estimates
+    P = np.ones(n)                # estimate variances
+    Q = np.full(n, 1e-4)          # process noise
+    R = NOISE_STD ** 2            # measurement noise
+
     for step in range(SIMULATION_STEPS):
         # update system dynamics
         omega = fx(omega, friction)
         measured = hx(omega)
 
         # simple temp model: proportional to speed
-        temp += 0.01 * measured  
+        temp += 0.01 * measured
 
-        # --- SAFETY CHECKS ---
-        if measured > MAX_SPEED:
-            logging.warning(f"Step {step}: Overspeed detected! ω={measured:.2f}")
-            print(f"⚠️ Simulation stopped at step {step}: Overspeed")
-            break
+        # noisy sensor readings for this step
+        z = np.array([measured, temp]) + rng.normal(0.0, NOISE_STD)
+
+        # vectorized Kalman predict+update across all sensors at once
+        P += Q
+        K = P / (P + R)
+        x += K * (z - x)
+        P *= 1.0 - K
 
-        if temp > MAX_TEMP:
-            logging.warning(f"Step {step}: Overtemperature detected! T={temp:.2f}")
-            print(f"⚠️ Simulation stopped at step {step}: Overtemperature")
+        # --- SAFETY CHECKS (on raw readings: the filter lags ramps and
+        # would trip late or not at all; x is for smoothing/logging only) ---
+        over = z > THRESHOLDS
+        if over.any():
+            names = [SENSORS[j] for j in np.where(over)[0]]
+            for name, val in zip(names, z[over]):
+                logger.warning("Step %d: %s over limit! value=%.2f", step, name, val)
+            print(f"⚠️ Simulation stopped at step {step}: {', '.join(names)} over limit")
             break
 
-        # log normal behavior
-        logging.info(f"Step {step}: ω={measured:.2f}, Temp={temp:.2f}")
+        # log normal behavior (formatting deferred to the handler)
+        if log_info:
+            logger.info("Step %d: ω=%.2f, Temp=%.2f", step, x[0], x[1])
@@ -0,0 +1,2 @@
+from .generator import run_generate
+from .pipeline import run_pipeline
@@ -0,0 +1,47 @@
+# Digital-twin physical and simulation constants
+
+DT = 0.1               # s, timestep
+STEPS = 3000           # total timesteps
+
+# Pump / motor dynamics
+J = 8.0                # kg*m^2, rotor inertia
+K_T = 9.5              # Nm/V, motor torque constant
+B0 = 1.0               # base viscous friction
+K_DEG = 2.0            # friction growth with accumulated wear
+ALPHA_WEAR = 1e-6      # wear accumulation rate
+T_ENV = 25.0           # °C, ambient temperature
+K_HEAT = 4e-4          # heating coefficient (from shaft speed)
+TAU_TH = 120.0         # s, thermal time constant
+
+# Measurement model
+K_Q = 0.35             # flow per rad/s at full valve opening
+K_P = 6.0              # bar, pressure scale
+K_VIB = 1e-5           # vibration scale
+CAV_OMEGA = 260.0      # rad/s, cavitation onset speed
+
+# Sensor noise (1 sigma)
+NOISE_OMEGA = 0.8
+NOISE_TEMP = 0.15
+NOISE_FLOW = 0.4
+NOISE_PRESSURE = 0.08
+NOISE_VIB = 0.02
+
+SENSOR_COLS = ["omega", "temperature", "flow", "pressure", "vibration"]
+NOISE_SIGMA = {
+    "omega": NOISE_OMEGA,
+    "temperature": NOISE_TEMP,
+    "flow": NOISE_FLOW,
+    "pressure": NOISE_PRESSURE,
+    "vibration": NOISE_VIB,
+}
+
+# Anomaly injection probabilities (per step)
+P_SPIKE = 0.004
+P_DRIFT = 0.002
+P_DROPOUT = 0.003
+
+# Monitoring pipeline
+WARMUP = 200           # steps used to learn baseline stats
+SIGMA_K = 4.0          # baseline-threshold width (in sigmas)
+KF_Q = 1e-3            # pipeline filter process noise
+KF_R = 0.5             # pipeline filter measurement noise
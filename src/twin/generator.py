@@ -0,0 +1,165 @@
+"""Synthetic pump telemetry generator for the digital twin."""
+import csv
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional: fall back to pure Python
+    def njit(*args, **kwargs):
+        return lambda f: f
+
+from . import constants as C
+from .constants import DT, T_ENV
+from .models import fx, hx
+
+RNG = np.random.default_rng(42)
+
+# per-channel noise sigmas in SENSOR_COLS order (compile-time constant below)
+_SIGMA = np.array([C.NOISE_SIGMA[s] for s in C.SENSOR_COLS])
+
+
+def input_profile(steps):
+    """Operating inputs (supply voltage, load, valve opening) for all steps."""
+    t = np.arange(steps)
+
+    V = 24.0 + 2.0 * np.tanh((t - 200) / 200.0) + RNG.normal(0, 0.1, size=steps)
+    V[(t % 400) > 300] += 1.0
+
+    TL = 0.8 + 0.2 * (1 + np.sin(t / 180 * np.pi))
+    TL[(t % 500) > 400] *= 1.2
+
+    valve = np.clip(
+        0.8 - 0.15 * (1 + np.sin((t - 500) / 180 * np.pi)) + RNG.normal(0, 0.05, size=steps),
+        0.2,
+        1.0,
+    )
+    valve[(t > 1500) & (t < 1800)] *= 0.55
+
+    return V, TL, valve
+
+
+def draw_noise_tape(steps):
+    """Pre-draw sensor noise and baseline drift as (steps, n_sensors) arrays."""
+    n = len(C.SENSOR_COLS)
+
+    # standard normals drawn into preallocated buffers, scaled in place, so
+    # no per-channel temporaries are allocated
+    noise = np.empty((steps, n))
+    RNG.standard_normal(out=noise)
+    noise *= _SIGMA
+    np.abs(noise[:, -1], out=noise[:, -1])  # vibration noise is one-sided
+
+    # slow baseline drift (sensor aging): a random walk per channel
+    drift = np.empty((steps, n))
+    RNG.standard_normal(out=drift)
+    drift *= 0.0005
+    drift *= RNG.uniform(0.05, 0.2, size=(steps, n))
+    np.cumsum(drift, axis=0, out=drift)
+    return noise, drift
+
+
+def inject_anomalies(sensors):
+    """
+    Apply spike, drift and dropout anomalies to the (steps, n_sensors)
+    array in vectorized sweeps: rare events are located with boolean masks
+    first, so Python-level work is O(number of events). Returns the three
+    int8 label vectors.
+    """
+    steps, n = sensors.shape
+    lbl_spike = np.zeros(steps, dtype=np.int8)
+    lbl_drift = np.zeros(steps, dtype=np.int8)
+    lbl_dropout = np.zeros(steps, dtype=np.int8)
+
+    # spikes: single-step outliers far outside the noise band
+    spike_rows = np.where(RNG.random(steps) < C.P_SPIKE)[0]
+    spike_cols = RNG.integers(0, n, size=spike_rows.size)
+    # branchless +/-1: 2*(u < 0.5) - 1 instead of a where/select
+    spike_sign = 2.0 * (RNG.random(spike_rows.size) < 0.5) - 1.0
+    sensors[spike_rows, spike_cols] += spike_sign * 10.0 * _SIGMA[spike_cols]
+    lbl_spike[spike_rows] = 1
+
+    # drift: starts at the first triggered step, sticks to one sensor and
+    # keeps growing -- a single ramp added to the column tail
+    trig = np.where(RNG.random(steps) < C.P_DRIFT)[0]
+    if trig.size:
+        start = trig[0]
+        j = int(RNG.integers(0, n))
+        rate = RNG.uniform(0.05, 0.2) * _SIGMA[j]
+        sensors[start:, j] += rate * np.arange(1, steps - start + 1)
+        lbl_drift[start:] = 1
+
+    # dropouts: sensor returns NaN for a step
+    drop_rows = np.where(RNG.random(steps) < C.P_DROPOUT)[0]
+    drop_cols = RNG.integers(0, n, size=drop_rows.size)
+    sensors[drop_rows, drop_cols] = np.nan
+    lbl_dropout[drop_rows] = 1
+
+    return lbl_spike, lbl_drift, lbl_dropout
+
+
+@njit(cache=True, fastmath=True)
+def _simulate(V, TL, valve, sensors):
+    """
+    Fused simulation kernel: dynamics and measurement in one compiled loop.
+    State stays in scalars; clean measurements are written in place into
+    the preallocated (steps, n_sensors) `sensors` array.
+    """
+    omega, theta, Tm = 0.0, 0.0, T_ENV
+
+    for t in range(V.shape[0]):
+        omega, theta, Tm, omega_sq = fx(omega, theta, Tm, V[t], TL[t], valve[t], DT)
+        m0, m1, m2, m3, m4 = hx(omega, theta, Tm, valve[t], omega_sq)
+        sensors[t, 0] = m0
+        sensors[t, 1] = m1
+        sensors[t, 2] = m2
+        sensors[t, 3] = m3
+        sensors[t, 4] = m4
+
+
+def run_generate(steps=C.STEPS, save_path="twin_data.csv"):
+    """Simulate the pump and write a labelled telemetry CSV."""
+    ts0 = datetime(2025, 1, 1)
+
+    # whole input profile and all random draws computed up front
+    V_arr, TL_arr, valve_arr = input_profile(steps)
+    noise, drift = draw_noise_tape(steps)
+
+    # clean simulation first, then noise/drift/anomalies as array sweeps
+    sensors = np.empty((steps, len(C.SENSOR_COLS)))
+    _simulate(V_arr, TL_arr, valve_arr, sensors)
+    sensors += noise
+    sensors += drift
+    lbl_spike, lbl_drift, lbl_dropout = inject_anomalies(sensors)
+
+    # the whole timestamp column in one date_range call (no per-step
+    # datetime/timedelta objects), shared by the CSV and the DataFrame
+    timestamps = pd.date_range(ts0, periods=steps, freq=pd.Timedelta(seconds=C.DT))
+    t_idx = np.arange(steps)
+
+    # stream rows straight from the column arrays: the write path never
+    # materializes a second copy of the table through pandas
+    header = ["t", "timestamp", "V", "load_torque", "valve",
+              *C.SENSOR_COLS, "label_spike", "label_drift", "label_dropout"]
+    with open(save_path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(header)
+        w.writerows(zip(t_idx, timestamps.astype(str), V_arr, TL_arr, valve_arr,
+                        *(sensors[:, j] for j in range(sensors.shape[1])),
+                        lbl_spike, lbl_drift, lbl_dropout))
+
+    data = {
+        "t": t_idx,
+        "timestamp": timestamps,
+        "V": V_arr,
+        "load_torque": TL_arr,
+        "valve": valve_arr,
+    }
+    for j, s in enumerate(C.SENSOR_COLS):
+        data[s] = sensors[:, j]
+    data["label_spike"] = lbl_spike
+    data["label_drift"] = lbl_drift
+    data["label_dropout"] = lbl_dropout
+    return pd.DataFrame(data)
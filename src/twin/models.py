@@ -0,0 +1,71 @@
+import math
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional: fall back to pure Python
+    def njit(*args, **kwargs):
+        return lambda f: f
+
+from .constants import (
+    J, K_T, B0, K_DEG, ALPHA_WEAR, T_ENV, K_HEAT, TAU_TH,
+    K_Q, K_P, K_VIB, CAV_OMEGA,
+)
+
+
+@njit(cache=True, fastmath=True)
+def saturate(val, lo, hi):
+    """Clamp val into [lo, hi]."""
+    if val < lo:
+        return lo
+    if val > hi:
+        return hi
+    return val
+
+
+@njit(cache=True, fastmath=True)
+def cavitation_factor(omega):
+    """Flow loss once the pump approaches cavitation speed."""
+    excess = (omega - CAV_OMEGA) / CAV_OMEGA
+    if excess < 0.0:
+        excess = 0.0
+    return 1.0 - 0.3 * math.tanh(3.0 * excess)
+
+
+@njit(cache=True, fastmath=True)
+def fx(omega, theta, Tm, V, TL, valve, dt):
+    """
+    Process model on plain floats: shaft speed (rad/s), accumulated wear,
+    motor temperature (°C), driven by supply voltage V, load factor TL and
+    valve opening. Returns the next (omega, theta, Tm) plus omega squared,
+    which hx reuses, as a tuple so Numba compiles an allocation-free leaf
+    function.
+    """
+    friction = B0 * (1.0 + K_DEG * theta)
+    domega = (K_T * V - 20.0 * TL - friction * omega) / J
+    omega = saturate(omega + domega * dt, 0.0, 400.0)
+
+    theta = theta + ALPHA_WEAR * abs(omega) * dt
+
+    omega_sq = omega * omega  # shared with hx via the return value
+    dTm = (K_HEAT * omega_sq - (Tm - T_ENV)) / TAU_TH
+    Tm = Tm + dTm * dt
+
+    return omega, theta, Tm, omega_sq
+
+
+@njit(cache=True, fastmath=True)
+def hx(omega, theta, Tm, valve, omega_sq):
+    """
+    Measurement model: returns the five sensor channels
+    (omega, temperature, flow, pressure, vibration) as a tuple.
+    omega_sq is the square fx already computed for the thermal term.
+    """
+    flow = K_Q * omega * valve * cavitation_factor(omega)
+    pressure = K_P * valve * (1.0 + math.tanh((omega - 200.0) / 200.0))
+    vibration = K_VIB * omega_sq * (1.0 + 50.0 * theta)
+    return omega, Tm, flow, pressure, vibration
+
+
+# warm the JIT caches at import so the first simulation step isn't slow
+fx(0.0, 0.0, T_ENV, 24.0, 1.0, 0.8, 0.1)
+hx(0.0, 0.0, T_ENV, 0.8, 0.0)